@@ -1,21 +1,39 @@
-from pathlib import Path
+from collections import OrderedDict
+import os
 import platform
 import atexit
+import subprocess
+from threading import Event, Lock, Thread
+from itertools import count
+import logging
 from typing import Callable, Dict, Union
 
 
+_log = logging.getLogger("playsound3")
+
 _PLAYSOUND_DEFAULT_BACKEND = None
+_BACKEND_READY = Event()
 _SYSTEM = platform.system()
 _DOWNLOAD_CACHE = {}
+_DOWNLOADS_IN_FLIGHT: Dict[str, dict] = {}
+_download_lock = Lock()
+_PATH_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_PATH_CACHE_SIZE = 256
+# How much of a remote file must be on disk before playback may start.
+_STREAM_READY_BYTES = 16 * 1024
 
 class PlaysoundException(Exception):
     pass
 
 def playsound(sound, block: bool = True, backend: Union[str, None] = None, daemon=True):
     """Play a sound file using an audio backend available in your system."""
-    global _PLAYSOUND_DEFAULT_BACKEND
     if _PLAYSOUND_DEFAULT_BACKEND is None:
-        _initialize_default_backend()
+        # Backend selection was started at import time; normally it has
+        # long finished and this wait is a single atomic read.
+        _BACKEND_READY.wait()
+        if _PLAYSOUND_DEFAULT_BACKEND is None:
+            # The import-time probe failed; rerun it to surface the error.
+            _initialize_default_backend()
 
     if backend is None:
         _play = _PLAYSOUND_DEFAULT_BACKEND
@@ -24,104 +42,403 @@ def playsound(sound, block: bool = True, backend: Union[str, None] = None, daemo
     else:
         raise PlaysoundException(f"Unknown backend: {backend}. Available backends: {', '.join(AVAILABLE_BACKENDS)}")
 
-    path = _prepare_path(sound)
+    path = _prepare_path(sound, streaming=_play in _STREAMING_BACKENDS)
     if block:
         _play(path) # type: ignore
+    elif _SYSTEM == "Windows" and backend is None:
+        # Fire-and-forget: the shell launches the associated audio handler
+        # asynchronously, with no Python thread or MCI round-trips.
+        _playsound_shell_win(path)
     else:
-        from threading import Thread
         thread = Thread(target=_play, args=(path,), daemon=daemon)
         thread.start()
         return thread
 
-def _download_sound_from_web(link, destination):
+_SSL_CONTEXT = None
+
+def _get_ssl_context():
+    """Build and memoize the SSL context used for downloads.
+
+    create_default_context re-parses the whole certifi bundle, which costs
+    hundreds of ms; one context can serve every download.
+    """
+    global _SSL_CONTEXT
+    if _SSL_CONTEXT is None:
+        from ssl import create_default_context
+        from certifi import where
+        _SSL_CONTEXT = create_default_context(cafile=where())
+    return _SSL_CONTEXT
+
+def _download_sound_from_web(link, destination, ready=None):
     from urllib.request import Request, urlopen
-    from ssl import create_default_context
-    from certifi import where
 
     headers = {"User-Agent": "Mozilla/5.0 (Windows NT 6.1; Win64; x64)"}
     request = Request(link, headers=headers)
-    context = create_default_context(cafile=where())
+    context = _get_ssl_context()
+    # Stream the response in chunks so peak memory stays bounded
+    # regardless of the size of the downloaded file. The chunk size
+    # matches _STREAM_READY_BYTES so streaming playback can start right
+    # after the first chunk lands on disk.
+    written = 0
     with urlopen(request, context=context) as response, open(destination, "wb") as out_file:
-        out_file.write(response.read())
-
-def _prepare_path(sound) -> str:
-    from pathlib import Path
-    from tempfile import NamedTemporaryFile
-
+        # Preallocate the file to its final size to avoid fragmented
+        # extents. Only on Windows, where the caller waits for the whole
+        # download: on other systems a streaming backend may already be
+        # reading the file and would mistake the zero padding for audio.
+        if _SYSTEM == "Windows":
+            content_length = response.headers.get("Content-Length")
+            if content_length:
+                try:
+                    out_file.truncate(int(content_length))
+                except (OSError, ValueError):
+                    pass
+        while True:
+            chunk = response.read(_STREAM_READY_BYTES)
+            if not chunk:
+                break
+            out_file.write(chunk)
+            written += len(chunk)
+            if ready is not None and not ready.is_set() and written >= _STREAM_READY_BYTES:
+                out_file.flush()
+                ready.set()
+
+def _download_destination(link: str) -> str:
+    """Map a URL to its path in the on-disk download cache."""
+    from hashlib import sha256
+    key = sha256(link.encode()).hexdigest()
+    return os.path.join(_cache_dir(), key + os.path.splitext(link)[1])
+
+def _start_download(link: str) -> dict:
+    """Kick off a background download of a remote sound.
+
+    Returns an in-flight entry whose "ready" event is set once enough of
+    the partial file is on disk for a streaming backend to start playing
+    it, or once the download failed (then "error" holds the exception).
+    The finished file is renamed into the cache atomically.
+    """
+    destination = _download_destination(link)
+    partial = destination + ".part"
+    os.makedirs(_cache_dir(), exist_ok=True)
+    ready = Event()
+    entry = {"partial": partial, "destination": destination, "ready": ready, "error": None}
+
+    def _worker():
+        try:
+            _download_sound_from_web(link, partial, ready)
+            os.replace(partial, destination)
+            _DOWNLOAD_CACHE[link] = destination
+        except Exception as error:
+            entry["error"] = error
+            try:
+                os.remove(partial)
+            except OSError:
+                pass
+        finally:
+            ready.set()
+            _DOWNLOADS_IN_FLIGHT.pop(link, None)
+
+    thread = Thread(target=_worker, daemon=True)
+    entry["thread"] = thread
+    _DOWNLOADS_IN_FLIGHT[link] = entry
+    thread.start()
+    return entry
+
+def _fetch_sound(link: str, streaming: bool = False) -> str:
+    """Return a local path for a remote sound, downloading it if needed.
+
+    Raises the download error (e.g. HTTPError) on the caller's thread if
+    the sound could not be fetched.
+    """
+    # The cache checks and _start_download must be serialized, otherwise
+    # concurrent first plays of one URL would each start a download that
+    # truncates the shared .part file under the others.
+    with _download_lock:
+        cached = _DOWNLOAD_CACHE.get(link)
+        if cached is not None:
+            return cached
+
+        entry = _DOWNLOADS_IN_FLIGHT.get(link)
+        if entry is None:
+            # A previous process may have downloaded this URL already; a
+            # stat is all it takes to skip the network entirely.
+            destination = _download_destination(link)
+            if os.path.isfile(destination):
+                _DOWNLOAD_CACHE[link] = destination
+                return destination
+            entry = _start_download(link)
+
+    # Backends that consume a growing file only need the first chunks;
+    # the rest (winmm, afplay, aplay/mpg123) need the complete file or
+    # they would stop at the temporary EOF.
+    if streaming:
+        entry["ready"].wait()
+    else:
+        entry["thread"].join()
+    if entry["error"] is not None:
+        raise entry["error"]
+    final = _DOWNLOAD_CACHE.get(link)
+    if final is not None:
+        return final
+    if os.path.isfile(entry["partial"]):
+        return entry["partial"]
+    # The worker renamed the partial file between our checks.
+    return entry["destination"]
+
+def _prepare_path(sound, streaming: bool = False) -> str:
     if isinstance(sound, str) and sound.startswith(("http://", "https://")):
-        if sound not in _DOWNLOAD_CACHE:
-            sound_suffix = Path(sound).suffix
-            with NamedTemporaryFile(delete=False, prefix="playsound3-", suffix=sound_suffix) as f:
-                _download_sound_from_web(sound, f.name)
-                _DOWNLOAD_CACHE[sound] = f.name
-        sound = _DOWNLOAD_CACHE[sound]
-
-    path = Path(sound)
-    if not path.exists():
+        # _fetch_sound either hands back the absolute path of a file it
+        # wrote or raises the download error, so there is nothing to
+        # re-validate here; if a cached file was deleted externally the
+        # backend will report it anyway.
+        return _fetch_sound(sound, streaming).replace(os.sep, "/")
+
+    # Resolving a path costs a stat syscall; remember recent results so
+    # sounds replayed in a tight loop skip it.
+    cached = _PATH_CACHE.get(sound)
+    if cached is not None:
+        return cached
+
+    # A single stat both validates existence and settles the path; for
+    # absolute inputs (such as cached downloads) abspath's getcwd call is
+    # skipped as well.
+    if os.path.isabs(sound):
+        result = os.fspath(sound)
+    else:
+        result = os.path.abspath(sound)
+    try:
+        os.stat(result)
+    except OSError:
         raise PlaysoundException(f"File not found: {sound}")
-    return path.absolute().as_posix()
+    result = result.replace(os.sep, "/")
+    _PATH_CACHE[sound] = result
+    if len(_PATH_CACHE) > _PATH_CACHE_SIZE:
+        _PATH_CACHE.popitem(last=False)
+    return result
+
+def _which_multi(names) -> Dict[str, str]:
+    """Locate several binaries with a single pass over $PATH.
+
+    Does one os.scandir per PATH entry instead of a full PATH traversal
+    per binary, and stops as soon as every name has been found.
+    """
+    remaining = set(names)
+    found: Dict[str, str] = {}
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        try:
+            with os.scandir(directory or ".") as entries:
+                for entry in entries:
+                    if entry.name in remaining and entry.is_file() and os.access(entry.path, os.X_OK):
+                        found[entry.name] = entry.path
+                        remaining.discard(entry.name)
+        except OSError:
+            continue
+        if not remaining:
+            break
+    return found
+
+def _cache_dir() -> str:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "playsound3")
+
+def _backend_cache_file() -> str:
+    return os.path.join(_cache_dir(), "backend")
 
 def _select_linux_backend() -> Callable[[str], None]:
-    from subprocess import run, DEVNULL
-    from logging import info
+    from shutil import which
 
-    info("Selecting the best available audio backend for Linux systems.")
+    if _log.isEnabledFor(logging.INFO):
+        _log.info("Selecting the best available audio backend for Linux systems.")
 
-    try:
-        run(["gst-play-1.0", "--version"], stdout=DEVNULL, stderr=DEVNULL, check=True)
-        return _playsound_gst_play
-    except FileNotFoundError:
-        pass
+    # With PyGObject available, a persistent playbin pipeline beats
+    # forking gst-play-1.0 for every sound.
+    gst_backend = _playsound_gst_reuse if _gi_available() else _playsound_gst_play
+    binaries = {"gst-play-1.0": gst_backend, "ffplay": _playsound_ffplay, "aplay": _playsound_alsa}
 
+    # Backend selection is persisted across processes so that subsequent
+    # runs skip the probing entirely.
+    cache_file = _backend_cache_file()
     try:
-        run(["ffplay", "-version"], stdout=DEVNULL, stderr=DEVNULL, check=True)
-        return _playsound_ffplay
-    except FileNotFoundError:
+        with open(cache_file) as f:
+            cached = f.read().strip()
+        if cached in binaries:
+            resolved = which(cached)
+            if resolved:
+                _BINARY_PATHS[cached] = resolved
+                return binaries[cached]
+    except OSError:
         pass
 
-    try:
-        run(["aplay", "--version"], stdout=DEVNULL, stderr=DEVNULL, check=True)
-        return _playsound_alsa
-    except FileNotFoundError:
-        pass
+    present = _which_multi(binaries)
+    _BINARY_PATHS.update(present)
+    for binary, backend in binaries.items():
+        if binary in present:
+            try:
+                os.makedirs(_cache_dir(), exist_ok=True)
+                with open(cache_file + ".tmp", "w") as f:
+                    f.write(binary)
+                os.replace(cache_file + ".tmp", cache_file)
+            except OSError:
+                pass
+            return backend
 
     raise PlaysoundException("No suitable audio backend found. Install gstreamer or ffmpeg!")
 
+_BINARY_PATHS: Dict[str, str] = {}
+
+# One shared fd for silencing backend output, opened once instead of per
+# spawn (subprocess resolves the DEVNULL sentinel with an open syscall
+# every time).
+_DEVNULL_FD = os.open(os.devnull, os.O_RDWR)
+atexit.register(os.close, _DEVNULL_FD)
+
+def _resolve_binary(name: str) -> str:
+    """Resolve and cache the absolute path of a backend binary."""
+    path = _BINARY_PATHS.get(name)
+    if path is None:
+        from shutil import which
+        path = which(name)
+        if path is None:
+            raise PlaysoundException(f"Binary not found: {name}")
+        _BINARY_PATHS[name] = path
+    return path
+
+def _spawn_and_wait(name: str, args, quiet: bool = False) -> None:
+    """Run a backend binary and wait until it finishes.
+
+    Uses os.posix_spawn with a pre-resolved absolute path where available,
+    which skips the PATH search and fd-table scan that subprocess.run pays
+    on every call. Falls back to subprocess.run on Python 3.7 and Windows.
+    """
+    binary = _resolve_binary(name)
+    posix_spawn = getattr(os, "posix_spawn", None)
+    if posix_spawn is None:
+        stdio = _DEVNULL_FD if quiet else None
+        subprocess.run([binary, *args], check=True, stdout=stdio, stderr=stdio)
+        return
+
+    file_actions = []
+    if quiet:
+        file_actions = [(os.POSIX_SPAWN_DUP2, _DEVNULL_FD, 1), (os.POSIX_SPAWN_DUP2, _DEVNULL_FD, 2)]
+    pid = posix_spawn(binary, [binary, *args], os.environ, file_actions=file_actions)
+    _, status = os.waitpid(pid, 0)
+    if status != 0:
+        if hasattr(os, "waitstatus_to_exitcode"):  # Python 3.9+
+            exitcode = os.waitstatus_to_exitcode(status)
+        elif os.WIFSIGNALED(status):
+            exitcode = -os.WTERMSIG(status)
+        else:
+            exitcode = os.WEXITSTATUS(status)
+        raise PlaysoundException(f"{name} failed to play the sound (exit code {exitcode})")
+
 def _playsound_gst_play(sound: str) -> None:
-    from subprocess import run
-    run(["gst-play-1.0", "--no-interactive", "--quiet", sound], check=True)
+    _spawn_and_wait("gst-play-1.0", ["--no-interactive", "--quiet", sound])
 
 def _playsound_ffplay(sound: str) -> None:
-    from subprocess import run, DEVNULL
-    run(
-        ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", sound],
-        check=True,
-        stdout=DEVNULL,
+    # The low-latency flags skip ffplay's default input probing and
+    # buffering (~1.5 s) so playback starts almost immediately, at the
+    # cost of possibly truncating the first few ms of very short files.
+    _spawn_and_wait(
+        "ffplay",
+        [
+            "-nodisp",
+            "-autoexit",
+            "-loglevel", "quiet",
+            "-fflags", "nobuffer",
+            "-flags", "low_delay",
+            "-probesize", "32",
+            "-analyzeduration", "0",
+            sound,
+        ],
+        quiet=True,
     )
 
 def _playsound_alsa(sound: str) -> None:
-    from pathlib import Path
-    from subprocess import run
-    suffix = Path(sound).suffix
+    suffix = os.path.splitext(sound)[1]
     if suffix == ".wav":
-        run(["aplay", "--quiet", sound], check=True)
+        _spawn_and_wait("aplay", ["--quiet", sound])
     elif suffix == ".mp3":
-        run(["mpg123", "-q", sound], check=True)
+        _spawn_and_wait("mpg123", ["-q", sound])
     else:
         raise PlaysoundException(f"Backend not supported for {suffix} files")
 
+_gi = None
+
+def _gi_available() -> bool:
+    """Check whether PyGObject can be imported, without importing it."""
+    from importlib.util import find_spec
+    try:
+        return find_spec("gi") is not None
+    except (ImportError, ValueError):
+        return False
+
+def _get_gi():
+    """Import and memoize the optional PyGObject module."""
+    global _gi
+    if _gi is None:
+        try:
+            import gi
+        except ImportError:
+            raise PlaysoundException("PyGObject not found. Run 'pip install pygobject'")
+        _gi = gi
+    return _gi
+
+_gst_playbin = None
+_gst_playbin_lock = Lock()
+
+def _playsound_gst_reuse(sound: str) -> None:
+    """Play a sound using a persistent GStreamer playbin element.
+
+    The pipeline (and GStreamer's plugin registry scan) is built on the
+    first call and reused afterwards, so repeated playbacks skip both the
+    gst-play-1.0 process startup and the plugin discovery cost. When the
+    shared pipeline is already playing, concurrent calls fall back to a
+    fresh playbin so they do not cut each other off.
+    """
+    from urllib import request as urlrequest
+
+    global _gst_playbin
+
+    if not _gst_playbin_lock.acquire(blocking=False):
+        _playsound_gst_legacy(sound)
+        return
+
+    try:
+        gi = _get_gi()
+        gi.require_version("Gst", "1.0")
+
+        try:
+            from gi.repository import Gst
+        except ImportError:
+            raise PlaysoundException("GStreamer not found. Install GStreamer on your system")
+
+        if _gst_playbin is None:
+            Gst.init(None)
+            _gst_playbin = Gst.ElementFactory.make("playbin", "playbin")
+
+        if not sound.startswith("file://"):
+            sound = "file://" + urlrequest.pathname2url(sound)
+
+        _gst_playbin.set_state(Gst.State.NULL)
+        _gst_playbin.props.uri = sound
+        set_result = _gst_playbin.set_state(Gst.State.PLAYING)
+        if set_result != Gst.StateChangeReturn.ASYNC:
+            raise PlaysoundException("playbin.set_state returned " + repr(set_result))
+        bus = _gst_playbin.get_bus()
+        try:
+            bus.poll(Gst.MessageType.EOS, Gst.CLOCK_TIME_NONE)
+        finally:
+            _gst_playbin.set_state(Gst.State.NULL)
+    finally:
+        _gst_playbin_lock.release()
+
 def _playsound_gst_legacy(sound: str) -> None:
-    from logging import debug as logdebug
     from urllib import request as urlrequest
     """Play a sound using gstreamer (built-in Linux)."""
 
     if not sound.startswith("file://"):
         sound = "file://" + urlrequest.pathname2url(sound)
 
-    try:
-        import gi
-    except ImportError:
-        raise PlaysoundException("PyGObject not found. Run 'pip install pygobject'")
+    gi = _get_gi()
 
     # Silences gi warning
     gi.require_version("Gst", "1.0")
@@ -137,7 +454,8 @@ def _playsound_gst_legacy(sound: str) -> None:
     playbin = Gst.ElementFactory.make("playbin", "playbin")
     playbin.props.uri = sound
 
-    logdebug("gstreamer: starting playing %s", sound)
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("gstreamer: starting playing %s", sound)
     set_result = playbin.set_state(Gst.State.PLAYING)
     if set_result != Gst.StateChangeReturn.ASYNC:
         raise PlaysoundException("playbin.set_state returned " + repr(set_result))
@@ -146,63 +464,118 @@ def _playsound_gst_legacy(sound: str) -> None:
         bus.poll(Gst.MessageType.EOS, Gst.CLOCK_TIME_NONE)
     finally:
         playbin.set_state(Gst.State.NULL)
-    logdebug("gstreamer: finishing play %s", sound)
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("gstreamer: finishing play %s", sound)
 
 
-def _send_winmm_mci_command(command):
-    from logging import error as logerror
-    from ctypes import WinDLL, create_string_buffer, c_char_p
-    winmm = WinDLL("winmm.dll")
-    buffer = create_string_buffer(255)
-    error_code = winmm.mciSendStringA(c_char_p(command.encode()), buffer, 254, 0)
+if _SYSTEM == "Windows":
+    # Load winmm.dll once and prebind mciSendStringA with typed arguments,
+    # so each MCI command is a direct FFI call with no loader overhead.
+    from ctypes import WinDLL, c_char_p, c_uint, c_void_p  # type: ignore[attr-defined]
+
+    _winmm = WinDLL("winmm.dll")
+    _mciSendStringA = _winmm.mciSendStringA
+    _mciSendStringA.argtypes = [c_char_p, c_char_p, c_uint, c_void_p]
+    _mciSendStringA.restype = c_uint
+
+
+def _send_winmm_mci_command(command, buffer=None):
+    from ctypes import create_string_buffer
+    if buffer is None:
+        buffer = create_string_buffer(255)
+    error_code = _mciSendStringA(command.encode(), buffer, 254, 0)
     if error_code:
-        logerror("MCI error code: %s", error_code)
+        _log.error("MCI error code: %s", error_code)
     return buffer.value
 
 
+_MCI_ALIAS_CACHE: Dict[str, str] = {}
+# Aliases never leave the process, so a counter is enough for uniqueness
+# and avoids the os.urandom syscall behind uuid4.
+_alias_counter = count()
+
 def _playsound_mci_winmm(sound: str) -> None:
     """Play a sound utilizing windll.winmm."""
-
-    # Select a unique alias for the sound
-    from logging import debug as logdebug
-    from uuid import uuid4
-    alias = str(uuid4())
-    logdebug("winmm: starting playing %s", sound)
-    _send_winmm_mci_command(f'open "{sound}" type mpegvideo alias {alias}')
-    _send_winmm_mci_command(f"play {alias} wait")
-    _send_winmm_mci_command(f"close {alias}")
-    logdebug("winmm: finishing play %s", sound)
+    from ctypes import create_string_buffer
+    buffer = create_string_buffer(255)
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("winmm: starting playing %s", sound)
+    alias = _MCI_ALIAS_CACHE.get(sound)
+    if alias is None:
+        # Opening loads the MCI driver and initializes the codec; keep the
+        # device open so replays of the same sound skip that cost.
+        alias = f"ps3_{next(_alias_counter)}"
+        _send_winmm_mci_command(f'open "{sound}" type mpegvideo alias {alias}', buffer)
+        _MCI_ALIAS_CACHE[sound] = alias
+    elif _send_winmm_mci_command(f"status {alias} mode", buffer) != b"stopped":
+        # The cached device is busy with a concurrent play of this sound;
+        # use a one-shot alias so we do not rewind its playback.
+        alias = f"ps3_{next(_alias_counter)}"
+        _send_winmm_mci_command(f'open "{sound}" type mpegvideo alias {alias}', buffer)
+        _send_winmm_mci_command(f"play {alias} wait", buffer)
+        _send_winmm_mci_command(f"close {alias}", buffer)
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("winmm: finishing play %s", sound)
+        return
+    _send_winmm_mci_command(f"seek {alias} to start", buffer)
+    _send_winmm_mci_command(f"play {alias} wait", buffer)
+    if _log.isEnabledFor(logging.DEBUG):
+        _log.debug("winmm: finishing play %s", sound)
+
+
+def _playsound_shell_win(sound: str) -> None:
+    """Launch the registered audio handler via the shell (Windows)."""
+    os.startfile(sound)  # type: ignore[attr-defined]
 
 
 def _playsound_afplay(sound: str) -> None:
     """Uses afplay utility (built-in macOS)."""
-    from subprocess import run
-    run(["afplay", sound], check=True)
+    _spawn_and_wait("afplay", [sound])
 
 def _initialize_default_backend() -> None:
     global _PLAYSOUND_DEFAULT_BACKEND
 
-    if _SYSTEM == "Windows":
-        _PLAYSOUND_DEFAULT_BACKEND = _playsound_mci_winmm
-    elif _SYSTEM == "Darwin":
-        _PLAYSOUND_DEFAULT_BACKEND = _playsound_afplay
-    else:
-        _PLAYSOUND_DEFAULT_BACKEND = _select_linux_backend()
+    try:
+        if _SYSTEM == "Windows":
+            _PLAYSOUND_DEFAULT_BACKEND = _playsound_mci_winmm
+        elif _SYSTEM == "Darwin":
+            _PLAYSOUND_DEFAULT_BACKEND = _playsound_afplay
+        else:
+            _PLAYSOUND_DEFAULT_BACKEND = _select_linux_backend()
+    finally:
+        _BACKEND_READY.set()
+
+def _close_mci_aliases(cache: Dict[str, str]) -> None:
+    for alias in cache.values():
+        _send_winmm_mci_command(f"close {alias}")
 
-def _remove_cached_downloads(cache: Dict[str, str]) -> None:
-    from os import remove
-    for path in cache.values():
-        remove(path)
+atexit.register(_close_mci_aliases, _MCI_ALIAS_CACHE)
 
-atexit.register(_remove_cached_downloads, _DOWNLOAD_CACHE)
+# Backends that can play a file while it is still being downloaded.
+_STREAMING_BACKENDS = frozenset(
+    {_playsound_ffplay, _playsound_gst_play, _playsound_gst_reuse, _playsound_gst_legacy}
+)
 
 _BACKEND_MAPPING = {
     "afplay": _playsound_afplay,
     "alsa_mpg123": _playsound_alsa,
     "ffplay": _playsound_ffplay,
     "gst_play": _playsound_gst_play,
+    "gst_reuse": _playsound_gst_reuse,
     "gst_legacy": _playsound_gst_legacy,
     "mci_winmm": _playsound_mci_winmm
 }
 
 AVAILABLE_BACKENDS = list(_BACKEND_MAPPING.keys())
+
+def _warmup_default_backend() -> None:
+    try:
+        _initialize_default_backend()
+    except PlaysoundException:
+        # No backend available; the first playsound() call will rerun the
+        # probe and raise the error on the caller's thread.
+        pass
+
+# Warm up backend selection in the background so the first playsound()
+# call does not pay for the probing.
+Thread(target=_warmup_default_backend, daemon=True).start()
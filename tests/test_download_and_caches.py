@@ -0,0 +1,138 @@
+import http.server
+import os
+import threading
+import time
+import urllib.error
+from collections import OrderedDict
+
+import pytest
+
+from playsound3 import playsound3
+
+
+def _start_server(payload=b"RIFF" + b"\x00" * 1024):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        hits = 0
+
+        def do_GET(self):
+            type(self).hits += 1
+            if self.path.endswith("missing.mp3"):
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}", Handler
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return
+        time.sleep(0.01)
+    raise AssertionError("condition not met in time")
+
+
+def test_download_error_propagates(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    base, _ = _start_server()
+    url = base + "/missing.mp3"
+    with pytest.raises(urllib.error.HTTPError):
+        playsound3._prepare_path(url)
+    # the failure is not cached and no partial file is left behind
+    assert not any(name.endswith(".part") for name in os.listdir(playsound3._cache_dir()))
+    with pytest.raises(urllib.error.HTTPError):
+        playsound3._prepare_path(url)
+
+
+def test_download_cache_survives_processes(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    base, handler = _start_server()
+    url = base + "/sample.wav"
+    playsound3._prepare_path(url)
+    _wait_for(lambda: url in playsound3._DOWNLOAD_CACHE)
+    # a fresh process starts with an empty in-memory cache but must find
+    # the file on disk instead of re-downloading it
+    monkeypatch.setattr(playsound3, "_DOWNLOAD_CACHE", {})
+    path = playsound3._prepare_path(url)
+    assert os.path.isfile(path)
+    assert handler.hits == 1
+
+
+def test_concurrent_first_plays_share_download(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    base, handler = _start_server()
+    url = base + "/sample.wav"
+    results = []
+    errors = []
+
+    def _prepare():
+        try:
+            results.append(playsound3._prepare_path(url))
+        except Exception as error:  # pragma: no cover - failure detail
+            errors.append(error)
+
+    threads = [threading.Thread(target=_prepare) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert len(set(results)) == 1
+    assert os.path.isfile(results[0])
+    assert handler.hits == 1
+
+
+def test_which_multi(monkeypatch, tmp_path):
+    bindir = tmp_path / "bin"
+    bindir.mkdir()
+    for name in ("tool-a", "tool-b"):
+        exe = bindir / name
+        exe.write_text("#!/bin/sh\n")
+        exe.chmod(0o755)
+    (bindir / "not-executable").write_text("")
+    monkeypatch.setenv("PATH", str(bindir))
+    found = playsound3._which_multi({"tool-a", "tool-b", "tool-c", "not-executable"})
+    assert found["tool-a"] == str(bindir / "tool-a")
+    assert found["tool-b"] == str(bindir / "tool-b")
+    assert "tool-c" not in found
+    if os.name == "posix":
+        assert "not-executable" not in found
+
+
+def test_path_cache_eviction(monkeypatch, tmp_path):
+    monkeypatch.setattr(playsound3, "_PATH_CACHE", OrderedDict())
+    monkeypatch.setattr(playsound3, "_PATH_CACHE_SIZE", 2)
+    files = []
+    for i in range(3):
+        sound = tmp_path / f"sound{i}.wav"
+        sound.write_bytes(b"RIFF")
+        files.append(str(sound))
+        playsound3._prepare_path(str(sound))
+    assert len(playsound3._PATH_CACHE) == 2
+    assert files[0] not in playsound3._PATH_CACHE
+    assert files[2] in playsound3._PATH_CACHE
+
+
+@pytest.mark.skipif(os.name != "posix", reason="probes POSIX executables")
+def test_backend_selection_is_cached(monkeypatch, tmp_path):
+    bindir = tmp_path / "bin"
+    bindir.mkdir()
+    exe = bindir / "ffplay"
+    exe.write_text("#!/bin/sh\n")
+    exe.chmod(0o755)
+    monkeypatch.setenv("PATH", str(bindir))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert playsound3._select_linux_backend() is playsound3._playsound_ffplay
+    with open(playsound3._backend_cache_file()) as f:
+        assert f.read().strip() == "ffplay"
+    # the second call takes the cache-file fast path
+    assert playsound3._select_linux_backend() is playsound3._playsound_ffplay